@@ -0,0 +1,103 @@
+"""
+gemsem_concepts 문서에 교과서 정보(subject, textbook_title) 채우기
+
+교과서 분석 시 개념 문서에 subject/textbook_title을 함께 저장하도록 바뀌기 전에 만들어진
+개념 문서를 한 번에 보정합니다. 여러 번 실행해도 안전합니다.
+
+배포 순서:
+    1. 서버 배포 (CONCEPT_METADATA_BACKFILLED 미설정 - 과목 필터가 예전 문서를 교과서 기준으로 함께 조회)
+    2. 이 스크립트 실행 후 "완료" 줄의 보정 수 확인 (--dry-run으로 다시 돌려 대상 0개인지 확인)
+    3. 서버에 CONCEPT_METADATA_BACKFILLED=true 설정 → 과목 필터가 개념 문서의 subject 쿼리 한 번으로 동작
+
+- 개념 문서는 필요한 필드만 페이지 단위로 읽고, 교과서는 get_all로 title/subject만 조회합니다.
+- 쓰기는 배치(최대 500건)로 묶어 update합니다.
+
+사용법:
+    python scripts/backfill_concept_metadata.py --dry-run
+    python scripts/backfill_concept_metadata.py --page-size 500
+"""
+import argparse
+
+from google.cloud import firestore
+
+BATCH_LIMIT = 500
+
+
+def iter_concepts(db, page_size: int):
+    """개념 문서를 문서 ID 순으로 페이지 단위 조회"""
+    query = (
+        db.collection('gemsem_concepts')
+        .select(['textbook_id', 'subject', 'textbook_title'])
+        .order_by('__name__')
+        .limit(page_size)
+    )
+    last = None
+    while True:
+        page = list((query.start_after(last) if last else query).stream())
+        if not page:
+            return
+        yield page
+        last = page[-1]
+
+
+def load_textbooks(db, textbook_ids: set, cache: dict):
+    """캐시에 없는 교과서의 title/subject를 한 번에 조회"""
+    missing = [textbook_id for textbook_id in textbook_ids if textbook_id not in cache]
+    if not missing:
+        return
+    refs = [db.collection('gemsem_textbooks').document(textbook_id) for textbook_id in missing]
+    for snapshot in db.get_all(refs, field_paths=['title', 'subject']):
+        cache[snapshot.id] = snapshot.to_dict() if snapshot.exists else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="개념 문서에 교과서 정보 채우기")
+    parser.add_argument("--project", default="gogwan")
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true", help="쓰지 않고 대상 문서 수만 출력")
+    args = parser.parse_args()
+
+    db = firestore.Client(project=args.project)
+    textbooks = {}
+    scanned = updated = orphaned = 0
+
+    for page in iter_concepts(db, args.page_size):
+        scanned += len(page)
+        # select 결과에는 없는 필드가 빠져 있고 snapshot.get은 KeyError를 내므로 to_dict()로 읽음
+        legacy = []
+        for snapshot in page:
+            data = snapshot.to_dict() or {}
+            if data.get('subject') is None or data.get('textbook_title') is None:
+                legacy.append((snapshot, data))
+        load_textbooks(db, {data.get('textbook_id') for _, data in legacy if data.get('textbook_id')}, textbooks)
+
+        batch = db.batch()
+        pending = 0
+        for snapshot, data in legacy:
+            textbook = textbooks.get(data.get('textbook_id'))
+            if not textbook:
+                orphaned += 1
+                continue
+            updated += 1
+            if args.dry_run:
+                continue
+            batch.update(snapshot.reference, {
+                'subject': textbook.get('subject'),
+                'textbook_title': textbook.get('title')
+            })
+            pending += 1
+            if pending == BATCH_LIMIT:
+                batch.commit()
+                batch = db.batch()
+                pending = 0
+        if pending:
+            batch.commit()
+
+        print(f"  {scanned}개 확인, {updated}개 {'대상' if args.dry_run else '수정'}")
+
+    print(f"\n완료: 개념 {scanned}개 중 {updated}개 {'보정 대상' if args.dry_run else '보정'}, "
+          f"교과서 없음 {orphaned}개")
+
+
+if __name__ == "__main__":
+    main()
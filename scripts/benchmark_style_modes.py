@@ -0,0 +1,141 @@
+"""
+스타일 변환 reference 모드 vs description 모드 벤치마크
+
+실행 중인 서버에 모든 내장 스타일 × 두 모드로 /api/convert-to-style 요청을 보내고
+지연 시간, 업로드 크기, 입력/출력 토큰, 추정 비용을 비교합니다.
+
+- 토큰 수는 요청 전후 /api/gemini/usage 차이로 계산하므로 다른 트래픽이 없는 서버에서 실행하세요.
+- upload는 서버가 Gemini로 보낸 페이로드 크기입니다 (/metrics의 gemini_request_payload_bytes).
+- 결과 캐시에 걸리지 않도록 매 요청마다 사진 끝(JPEG EOI 뒤)에 임의 바이트를 붙입니다.
+
+사용법:
+    python scripts/benchmark_style_modes.py photo.jpg --base-url http://localhost:8080 --runs 3
+"""
+import argparse
+import base64
+import json
+import os
+import re
+import statistics
+import time
+import urllib.request
+
+MODES = ("reference", "description")
+MODE_ENDPOINTS = {
+    "reference": "convert-to-style",
+    "description": "convert-to-style-description",
+}
+
+
+def request_json(url: str, payload: dict = None, timeout: float = 300):
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    req = urllib.request.Request(
+        url,
+        data=data,
+        headers={"Content-Type": "application/json", "Accept": "application/json"},
+        method="POST" if payload is not None else "GET"
+    )
+    with urllib.request.urlopen(req, timeout=timeout) as response:
+        return json.loads(response.read().decode("utf-8"))
+
+
+def usage_totals(base_url: str) -> dict:
+    """엔드포인트별 누적 토큰 사용량"""
+    totals = {}
+    for row in request_json(f"{base_url}/api/gemini/usage")["usage"]:
+        entry = totals.setdefault(row["endpoint"], {"prompt_tokens": 0, "candidates_tokens": 0, "estimated_cost_usd": 0.0})
+        entry["prompt_tokens"] += row["prompt_tokens"]
+        entry["candidates_tokens"] += row["candidates_tokens"]
+        entry["estimated_cost_usd"] += row["estimated_cost_usd"]
+    return totals
+
+
+def gemini_payload_bytes(base_url: str, endpoint: str) -> float:
+    """/metrics에서 해당 엔드포인트가 Gemini로 보낸 누적 페이로드 크기"""
+    req = urllib.request.Request(f"{base_url}/metrics")
+    with urllib.request.urlopen(req, timeout=30) as response:
+        text = response.read().decode("utf-8")
+    pattern = re.compile(r'^gemini_request_payload_bytes_sum\{[^}]*endpoint="' + re.escape(endpoint) + r'"[^}]*\} (\S+)$', re.M)
+    return sum(float(value) for value in pattern.findall(text))
+
+
+def run_once(base_url: str, photo: bytes, style: str, mode: str) -> dict:
+    payload = {
+        "image": base64.b64encode(photo + os.urandom(8)).decode("utf-8"),
+        "style": style,
+        "mode": mode
+    }
+    endpoint = MODE_ENDPOINTS[mode]
+    before = usage_totals(base_url).get(endpoint, {})
+    payload_before = gemini_payload_bytes(base_url, endpoint)
+
+    start = time.perf_counter()
+    request_json(f"{base_url}/api/convert-to-style", payload)
+    latency = time.perf_counter() - start
+
+    after = usage_totals(base_url).get(endpoint, {})
+    return {
+        "latency": latency,
+        "upload_bytes": gemini_payload_bytes(base_url, endpoint) - payload_before,
+        "prompt_tokens": after.get("prompt_tokens", 0) - before.get("prompt_tokens", 0),
+        "candidates_tokens": after.get("candidates_tokens", 0) - before.get("candidates_tokens", 0),
+        "cost": after.get("estimated_cost_usd", 0.0) - before.get("estimated_cost_usd", 0.0)
+    }
+
+
+def summarize(results: list) -> dict:
+    return {
+        "p50_latency": statistics.median(r["latency"] for r in results),
+        "mean_latency": statistics.mean(r["latency"] for r in results),
+        "upload_bytes": statistics.mean(r["upload_bytes"] for r in results),
+        "prompt_tokens": statistics.mean(r["prompt_tokens"] for r in results),
+        "candidates_tokens": statistics.mean(r["candidates_tokens"] for r in results),
+        "cost": statistics.mean(r["cost"] for r in results)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스타일 변환 모드 벤치마크")
+    parser.add_argument("photo", help="변환할 사진 (JPEG)")
+    parser.add_argument("--base-url", default="http://localhost:8080")
+    parser.add_argument("--runs", type=int, default=3, help="스타일/모드별 반복 횟수")
+    parser.add_argument("--styles", nargs="*", help="측정할 스타일 ID (기본: 전체)")
+    args = parser.parse_args()
+
+    base_url = args.base_url.rstrip("/")
+    with open(args.photo, "rb") as f:
+        photo = f.read()
+
+    styles = args.styles or [style["id"] for style in request_json(f"{base_url}/api/available-styles")["styles"]]
+    print(f"스타일 {len(styles)}개 × 모드 {len(MODES)}개 × {args.runs}회\n")
+
+    header = f"{'style':<16}{'mode':<13}{'p50(s)':>8}{'mean(s)':>9}{'gemini(KB)':>12}{'in tok':>9}{'out tok':>9}{'cost($)':>11}"
+    print(header)
+    print("-" * len(header))
+
+    overall = {mode: [] for mode in MODES}
+    for style in styles:
+        for mode in MODES:
+            results = []
+            for _ in range(args.runs):
+                try:
+                    results.append(run_once(base_url, photo, style, mode))
+                except Exception as e:
+                    print(f"{style:<16}{mode:<13} 실패: {e}")
+            if not results:
+                continue
+            overall[mode].extend(results)
+            s = summarize(results)
+            print(f"{style:<16}{mode:<13}{s['p50_latency']:>8.2f}{s['mean_latency']:>9.2f}"
+                  f"{s['upload_bytes'] / 1024:>12.1f}{s['prompt_tokens']:>9.0f}{s['candidates_tokens']:>9.0f}{s['cost']:>11.5f}")
+
+    print("-" * len(header))
+    for mode in MODES:
+        if overall[mode]:
+            s = summarize(overall[mode])
+            print(f"{'(전체)':<16}{mode:<13}{s['p50_latency']:>8.2f}{s['mean_latency']:>9.2f}"
+                  f"{s['upload_bytes'] / 1024:>12.1f}{s['prompt_tokens']:>9.0f}{s['candidates_tokens']:>9.0f}{s['cost']:>11.5f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+교과서/문제집 문서의 pdf_base64 필드를 blob 저장소로 옮기기
+
+업로드 시 PDF를 blob 저장소에 두고 문서에는 참조(pdf_blob)와 크기만 저장하도록 바뀌기 전에
+만들어진 문서를 옮깁니다. 서버와 같은 BLOB_STORE_* 환경 변수로 실행하세요.
+여러 번 실행해도 안전합니다 (이미 옮긴 문서는 건너뛰고, 같은 내용은 다시 쓰지 않음).
+
+- 문서 목록은 PDF 없이 필요한 필드만 읽고, PDF는 옮길 문서만 하나씩 읽습니다.
+- blob 저장 후 다시 읽어 내용이 같은지 확인한 다음에만 문서에서 pdf_base64를 지웁니다.
+
+사용법:
+    python scripts/migrate_pdf_blobs.py --dry-run
+    python scripts/migrate_pdf_blobs.py --keep-inline   # 문서의 pdf_base64는 남겨 둠
+"""
+import argparse
+import asyncio
+import base64
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from main import async_db, blob_store, firestore  # noqa: E402
+
+COLLECTIONS = ("gemsem_textbooks", "gemsem_workbooks")
+
+
+async def iter_documents(collection: str, page_size: int):
+    """PDF 필드 없이 문서를 문서 ID 순으로 페이지 단위 조회"""
+    query = (
+        async_db.collection(collection)
+        .select(['pdf_blob', 'pdf_size_bytes', 'title'])
+        .order_by('__name__')
+        .limit(page_size)
+    )
+    last = None
+    while True:
+        page = await async_db.query(query.start_after(last) if last else query)
+        if not page:
+            return
+        for snapshot in page:
+            yield snapshot
+        last = page[-1]
+
+
+async def migrate_document(snapshot, keep_inline: bool) -> int:
+    """문서 하나의 PDF를 blob 저장소로 옮기고 옮긴 바이트 수 반환 (PDF가 없으면 0)"""
+    pdf_snapshot = await async_db.get(snapshot.reference, field_paths=['pdf_base64'])
+    pdf_base64 = (pdf_snapshot.to_dict() or {}).get('pdf_base64') if pdf_snapshot.exists else None
+    if not pdf_base64:
+        return 0
+
+    pdf_bytes = base64.b64decode(pdf_base64)
+    pdf_blob = await blob_store.put(pdf_bytes)
+    if await blob_store.get(pdf_blob['key']) != pdf_bytes:
+        raise RuntimeError(f"blob 확인 실패: {snapshot.reference.path}")
+
+    update = {'pdf_blob': pdf_blob['key'], 'pdf_size_bytes': pdf_blob['size']}
+    if not keep_inline:
+        update['pdf_base64'] = firestore.DELETE_FIELD
+    await async_db.update(snapshot.reference, update)
+    return pdf_blob['size']
+
+
+async def run(args):
+    for collection in COLLECTIONS:
+        scanned = migrated = skipped = failed = 0
+        moved_bytes = 0
+        async for snapshot in iter_documents(collection, args.page_size):
+            scanned += 1
+            # select 결과에는 없는 필드가 빠져 있고 snapshot.get은 KeyError를 내므로 to_dict()로 읽음
+            if (snapshot.to_dict() or {}).get('pdf_blob'):
+                skipped += 1
+                continue
+            if args.dry_run:
+                migrated += 1
+                continue
+            try:
+                size = await migrate_document(snapshot, args.keep_inline)
+            except Exception as e:
+                failed += 1
+                print(f"  ⚠️ {snapshot.reference.path}: {str(e)}")
+                continue
+            if size:
+                migrated += 1
+                moved_bytes += size
+            else:
+                skipped += 1
+
+        print(f"{collection}: {scanned}개 확인, {migrated}개 {'대상' if args.dry_run else '이동'} "
+              f"({moved_bytes / 1024 / 1024:.1f} MB), {skipped}개 건너뜀, {failed}개 실패")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF를 문서 밖 blob 저장소로 이동")
+    parser.add_argument("--page-size", type=int, default=200)
+    parser.add_argument("--dry-run", action="store_true", help="옮기지 않고 대상 문서 수만 출력")
+    parser.add_argument("--keep-inline", action="store_true", help="문서의 pdf_base64 필드를 지우지 않음")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
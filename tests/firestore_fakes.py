@@ -0,0 +1,19 @@
+"""
+테스트용 Firestore 대역
+- DocumentSnapshot처럼 없는 필드는 get에서 KeyError, 없는 문서는 to_dict()가 None
+"""
+
+
+class FakeSnapshot:
+    def __init__(self, data: dict, doc_id: str = None):
+        self.id = doc_id if doc_id is not None else data['id']
+        self.exists = data is not None
+        self._data = data
+
+    def get(self, field):
+        if self._data is None or field not in self._data:
+            raise KeyError(field)
+        return self._data[field]
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
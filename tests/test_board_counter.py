@@ -0,0 +1,129 @@
+"""
+게시판 카테고리 글 수 카운터 (get_board_post_total / seed_board_counter) 테스트
+- Firestore 클라이언트와 트랜잭션을 메모리 대역으로 바꿔서 실행
+"""
+import asyncio
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import main  # noqa: E402
+from firestore_fakes import FakeSnapshot  # noqa: E402
+
+
+class FakeDocRef:
+    def __init__(self, db, path: str):
+        self.db = db
+        self.path = path
+        self.id = path.rsplit('/', 1)[-1]
+
+    def get(self, field_paths=None, transaction=None):
+        return FakeSnapshot(self.db.docs.get(self.path), doc_id=self.id)
+
+
+class FakeCount:
+    def __init__(self, value: int):
+        self.value = value
+
+
+class FakeQuery:
+    def __init__(self, db, collection: str, filters=()):
+        self.db = db
+        self.collection = collection
+        self.filters = filters
+
+    def where(self, field, op, value):
+        assert op == '=='
+        return FakeQuery(self.db, self.collection, self.filters + ((field, value),))
+
+    def count(self):
+        return self
+
+    def get(self, transaction=None):
+        prefix = self.collection + '/'
+        total = sum(
+            1 for path, data in self.db.docs.items()
+            if path.startswith(prefix) and all(data.get(field) == value for field, value in self.filters)
+        )
+        return [[FakeCount(total)]]
+
+
+class FakeCollection(FakeQuery):
+    def document(self, doc_id: str):
+        return FakeDocRef(self.db, f"{self.collection}/{doc_id}")
+
+
+class FakeTransaction:
+    def __init__(self, db):
+        self.db = db
+
+    def set(self, ref, data: dict, merge: bool = False):
+        current = dict(self.db.docs.get(ref.path) or {}) if merge else {}
+        current.update({
+            field: value for field, value in data.items() if value is not main.firestore.SERVER_TIMESTAMP
+        })
+        self.db.docs[ref.path] = current
+
+
+class FakeClient:
+    def __init__(self, docs: dict):
+        self.docs = docs
+
+    def collection(self, name: str):
+        return FakeCollection(self, name)
+
+    def transaction(self):
+        return FakeTransaction(self)
+
+
+def board_post_total(docs: dict, category: str) -> int:
+    client = FakeClient(docs)
+
+    async def fake_get(ref, field_paths=None):
+        return ref.get(field_paths)
+
+    async def fake_run(func, *args):
+        return func(*args)
+
+    originals = (main.get_firestore_client, main.firestore.transactional, main.async_db.get, main.async_db.run)
+    main.get_firestore_client = lambda: client
+    main.firestore.transactional = lambda func: func
+    main.async_db.get = fake_get
+    main.async_db.run = fake_run
+    try:
+        return asyncio.run(main.get_board_post_total(category))
+    finally:
+        main.get_firestore_client, main.firestore.transactional, main.async_db.get, main.async_db.run = originals
+
+
+def test_counter_with_only_posts_is_seeded_from_count():
+    # 집계 전에 글 작성이 posts만 증가시킨 카운터 (initialized 없음)
+    docs = {
+        'board_counters/자유게시판': {'category': '자유게시판', 'posts': 1},
+        'board_posts/a': {'category': '자유게시판'},
+        'board_posts/b': {'category': '자유게시판'},
+        'board_posts/c': {'category': '공지'},
+    }
+
+    assert board_post_total(docs, '자유게시판') == 2
+    assert docs['board_counters/자유게시판']['initialized'] is True
+    assert docs['board_counters/자유게시판']['posts'] == 2
+
+
+def test_initialized_counter_is_read_without_counting():
+    docs = {
+        'board_counters/자유게시판': {'category': '자유게시판', 'posts': 7, 'initialized': True},
+        'board_posts/a': {'category': '자유게시판'},
+    }
+
+    assert board_post_total(docs, '자유게시판') == 7
+
+
+def test_missing_counter_is_seeded():
+    docs = {'board_posts/a': {'category': '공지'}}
+
+    assert board_post_total(docs, '공지') == 1
+    assert docs['board_counters/공지']['posts'] == 1
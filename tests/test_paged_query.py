@@ -0,0 +1,97 @@
+"""
+문제/개념 조회 페이지네이션 (paged_query_response) 테스트
+- Firestore 대신 메모리 쿼리로 async_db.query를 바꿔서 실행
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import main  # noqa: E402
+from firestore_fakes import FakeSnapshot  # noqa: E402
+
+
+class FakeQuery:
+    """문서 ID 오름차순 정렬만 지원하는 메모리 쿼리"""
+
+    def __init__(self, rows: list, after: str = None, limit: int = None):
+        self.rows = rows
+        self.after = after
+        self._limit = limit
+
+    def order_by(self, field, direction=None):
+        assert field == '__name__'
+        return self
+
+    def start_after(self, values: dict):
+        return FakeQuery(self.rows, values['__name__'], self._limit)
+
+    def limit(self, count: int):
+        return FakeQuery(self.rows, self.after, count)
+
+    def run(self) -> list:
+        rows = sorted(self.rows, key=lambda row: row['id'])
+        if self.after is not None:
+            rows = [row for row in rows if row['id'] > self.after]
+        if self._limit is not None:
+            rows = rows[:self._limit]
+        return [FakeSnapshot(row) for row in rows]
+
+
+def make_rows(count: int) -> list:
+    return [{'id': f"p{index:05d}", 'problem_number': index} for index in range(count)]
+
+
+def fetch(query, **params):
+    async def fake_query(q):
+        return q.run()
+
+    original = main.async_db.query
+    main.async_db.query = fake_query
+    try:
+        return asyncio.run(main.paged_query_response(
+            query, 'problems', sort=None, allowed_sorts=main.PROBLEM_SORT_FIELDS, fields=None,
+            limit=params.get('limit'), cursor=params.get('cursor')
+        ))
+    finally:
+        main.async_db.query = original
+
+
+def test_no_limit_or_cursor_returns_every_row():
+    rows = make_rows(main.QUERY_PAGE_DEFAULT + 250)
+    result = fetch(FakeQuery(rows))
+
+    assert result['count'] == len(rows)
+    assert [item['id'] for item in result['problems']] == [row['id'] for row in rows]
+    assert result['next_cursor'] is None
+
+
+def test_following_next_cursor_returns_every_row_once():
+    rows = make_rows(main.QUERY_PAGE_DEFAULT + 250)
+    seen = []
+    result = fetch(FakeQuery(rows), limit=200)
+    seen += [item['id'] for item in result['problems']]
+    while result['next_cursor']:
+        result = fetch(FakeQuery(rows), limit=200, cursor=result['next_cursor'])
+        seen += [item['id'] for item in result['problems']]
+
+    assert seen == [row['id'] for row in rows]
+
+
+def test_fake_snapshot_raises_for_missing_field_like_firestore():
+    with pytest.raises(KeyError):
+        FakeSnapshot({'id': 'p00001'}).get('subject')
+
+
+def test_cursor_without_limit_uses_default_page_size():
+    rows = make_rows(main.QUERY_PAGE_DEFAULT * 2 + 10)
+    first = fetch(FakeQuery(rows), limit=10)
+    result = fetch(FakeQuery(rows), cursor=first['next_cursor'])
+
+    assert result['count'] == main.QUERY_PAGE_DEFAULT
+    assert result['next_cursor'] is not None